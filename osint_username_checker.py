@@ -5,17 +5,43 @@ Async username enumeration across multiple platforms
 """
 
 import asyncio
+import os
+import certifi
 import httpx
 import json
 import argparse
+import contextlib
 from pathlib import Path
-from typing import List, Dict, Optional
-from datetime import datetime
+from typing import List, Dict, Optional, Callable, Awaitable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from rich.console import Console
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskID
 from rich.panel import Panel
 import random
+import re
+import itertools
+import socket
+import ssl
+import time
+from urllib.parse import urlparse
+from aiolimiter import AsyncLimiter
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional: large sites files are parsed up front instead
+    ijson = None
+
+try:
+    import uvloop
+except ImportError:  # Optional: falls back to the default asyncio loop
+    uvloop = None
 
 console = Console()
 
@@ -27,13 +53,151 @@ USER_AGENTS = [
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15',
 ]
 
+# Prebuilt request headers, one per User-Agent (httpx sets Accept-Encoding itself)
+_UA_HEADERS = [{'User-Agent': ua, 'Accept': 'text/html'} for ua in USER_AGENTS]
+# Rotate through them in a shuffled order (single event loop, so no locking)
+_UA_CYCLE = itertools.cycle(random.sample(_UA_HEADERS, len(_UA_HEADERS)))
+
+# Detection types and the specialized check method that handles each
+_DETECTION_TYPES = {"status_code": "_check_status", "message_body": "_check_body"}
+
+# Push progress to the bar every this many completed sites
+PROGRESS_BATCH = 16
+
+# Longest the scan waits on up-front DNS lookups before starting requests anyway
+DNS_WARMUP_TIMEOUT = 2.0
+
+# Stream-parse sites files larger than this while the scan is already running
+STREAM_SITES_THRESHOLD = 1024 * 1024
+
+# Attempts per site when rate-limited (429) or timed out, and the longest backoff
+MAX_ATTEMPTS = 3
+RETRY_MAX_DELAY = 10
+
+def _default_ssl_context() -> ssl.SSLContext:
+    """Verified TLS context with the same trust roots httpx's verify=True would use"""
+    # Like httpx (trust_env), honor SSL_CERT_FILE / SSL_CERT_DIR, else certifi
+    cert_file = os.environ.get('SSL_CERT_FILE')
+    cert_dir = os.environ.get('SSL_CERT_DIR')
+    if cert_file and os.path.isfile(cert_file):
+        return ssl.create_default_context(cafile=cert_file)
+    if cert_dir and os.path.isdir(cert_dir):
+        return ssl.create_default_context(capath=cert_dir)
+    return ssl.create_default_context(cafile=certifi.where())
+
+# TLS contexts built once at import: verified by default, unverified for --insecure.
+# Safe to share across clients: httpcore sets ALPN on the context right before
+# wrapping each socket, with no await in between.
+_SSL_CTX = _default_ssl_context()
+_INSECURE_SSL_CTX = ssl.create_default_context()
+_INSECURE_SSL_CTX.check_hostname = False
+_INSECURE_SSL_CTX.verify_mode = ssl.CERT_NONE
+
+# Stop reading a page body after this many bytes when looking for an error message
+BODY_SCAN_LIMIT = 64 * 1024
+
+def _error_pattern(message: str):
+    """Compile an error message into a case-insensitive UTF-8 byte pattern
+
+    re.IGNORECASE only folds ASCII on bytes, so non-ASCII characters get explicit
+    alternatives for their upper/lower case forms. Returns (pattern, longest match
+    length in bytes), or (None, 0) for an empty message.
+    """
+    if not message:
+        return None, 0
+    parts = []
+    max_len = 0
+    for ch in message:
+        variants = sorted({ch, ch.lower(), ch.upper()})
+        encoded = [v.encode() for v in variants]
+        max_len += max(len(e) for e in encoded)
+        if ch.isascii():
+            parts.append(re.escape(ch.encode()))
+        else:
+            parts.append(b'(?:' + b'|'.join(re.escape(e) for e in encoded) + b')')
+    return re.compile(b''.join(parts), re.IGNORECASE), max_len
+
+def _is_number(value) -> bool:
+    """True for int/float config values (bool excluded)"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+class TokenBucket:
+    """Per-host token bucket (capacity tokens, refilled at rate tokens/sec)"""
+    def __init__(self, capacity: float, rate: float):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.last = time.monotonic()
+
+    def consume(self, tokens: float = 1) -> bool:
+        """Take tokens if available, returning False when the bucket is empty"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
+
 class UsernameChecker:
-    def __init__(self, sites_file: str = "sites.json", timeout: int = 10, rate_limit: float = 0.5):
+    def __init__(self, sites_file: str = "sites.json", timeout: int = 10,
+                 max_rate: float = 50.0, rate_limit: Optional[float] = None,
+                 host_capacity: float = 5, host_rate: float = 2.0,
+                 max_connections: int = 256, client: Optional[httpx.AsyncClient] = None,
+                 http2: bool = False, insecure: bool = False):
         self.sites_file = Path(sites_file)
         self.timeout = timeout
-        self.rate_limit = rate_limit
+        # Sent with every request so injected clients honor it too.
+        # No pool timeout: the semaphore already caps waiters at pool size.
+        self._timeout = httpx.Timeout(connect=5, read=timeout, write=5, pool=None)
+        # Shared leaky bucket: bursts run at full concurrency until it fills.
+        # Legacy "one request every N seconds" mode when rate_limit is set.
+        if rate_limit is not None:
+            if rate_limit <= 0:
+                raise ValueError("rate_limit must be > 0")
+            self.limiter = AsyncLimiter(1, rate_limit)
+        elif max_rate <= 0:
+            raise ValueError("max_rate must be > 0")
+        elif max_rate < 1:
+            # AsyncLimiter needs a capacity of at least one request
+            self.limiter = AsyncLimiter(1, 1 / max_rate)
+        else:
+            self.limiter = AsyncLimiter(max_rate, 1)
+        # Per-host buckets so a slow host never stalls unrelated ones
+        self.host_capacity = host_capacity
+        self.host_rate = host_rate
+        self._buckets: Dict[str, TokenBucket] = {}
+        # Cap in-flight requests at the connection pool size
+        if max_connections < 1:
+            raise ValueError("max_connections must be >= 1")
+        self.max_connections = max_connections
+        self._sem = asyncio.Semaphore(max_connections)
+        # Optional shared client, reused across scans and closed by aclose().
+        # http2, insecure and the pool limits only apply to clients built here,
+        # so an injected client must be created with matching settings
+        # (at least max_connections in its httpx.Limits).
+        self.client = client
+        # HTTP/1.1 by default: one request per host never benefits from multiplexing
+        self.http2 = http2
+        # Skip certificate verification (research targets with broken TLS)
+        self.insecure = insecure
         self.sites: List[Dict] = []
+        # Per-site fields as parallel arrays, indexed like self.sites
+        self._names: List[str] = []
+        self._templates: List[str] = []
+        self._urls: List[str] = []
+        self._site_buckets: List[TokenBucket] = []
+        self._checks: List[Callable[[int, str, TokenBucket, httpx.AsyncClient], Awaitable[Dict]]] = []
+        self._err_lens: List[int] = []
+        self._err_patterns: List[Optional[re.Pattern]] = []
+        self._bucket_caps: List[Optional[float]] = []
+        self._bucket_rates: List[Optional[float]] = []
         self.results: Dict[str, List[Dict]] = {"found": [], "not_found": [], "errors": []}
+        self._done = 0
+        # False when a scan was aborted and self.results is partial
+        self.scan_complete = True
+        # Large sites files are parsed during the scan (see load_sites)
+        self._stream_sites = False
         
     def load_sites(self) -> bool:
         """Load site configurations from JSON file"""
@@ -42,9 +206,19 @@ class UsernameChecker:
                 console.print(f"[red]Error: {self.sites_file} not found![/red]")
                 return False
             
-            with open(self.sites_file, 'r') as f:
-                data = json.load(f)
-                self.sites = data.get('sites', [])
+            self._reset_sites()
+            
+            # Defer big files to scan_username so parsing overlaps the first requests
+            size = self.sites_file.stat().st_size
+            self._stream_sites = ijson is not None and size > STREAM_SITES_THRESHOLD
+            if self._stream_sites:
+                console.print(f"[green]✓[/green] Streaming sites from {self.sites_file} ({size // 1024} KB)")
+                return True
+            
+            raw = self.sites_file.read_bytes()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
+            for site in data.get('sites', []):
+                self._add_site(site)
             
             console.print(f"[green]✓[/green] Loaded {len(self.sites)} sites from {self.sites_file}")
             return True
@@ -55,71 +229,299 @@ class UsernameChecker:
             console.print(f"[red]Error loading sites: {e}[/red]")
             return False
 
-    async def check_username(self, site: Dict, username: str, client: httpx.AsyncClient) -> Dict:
-        """Check if username exists on a specific site"""
-        site_name = site['name']
-        url = site['url_template'].format(username=username)
-        detection_type = site['detection_type']
+    def _reset_sites(self):
+        """Clear the site list and its parallel arrays"""
+        self.sites = []
+        self._names, self._templates, self._urls = [], [], []
+        self._site_buckets = []
+        self._err_lens, self._err_patterns = [], []
+        self._bucket_caps, self._bucket_rates = [], []
+        self._checks = []
+
+    def _add_site(self, site: Dict) -> int:
+        """Append a site config to the parallel arrays and return its index
+
+        Everything is read and validated before the first append, so a bad record
+        raises without leaving the arrays at different lengths.
+        """
+        name = site['name']
+        template = site['url_template']
+        # Unknown types are kept and reported as an error for that site alone
+        check = _DETECTION_TYPES.get(site.get('detection_type'), '_check_unknown')
+        # Compile error messages once into case-insensitive byte patterns
+        pattern, max_len = _error_pattern(site.get('error_message', ''))
         
-        result = {
-            'site': site_name,
+        # Bad bucket overrides would hang (capacity < 1) or divide by zero (rate 0)
+        capacity = site.get('bucket_capacity')
+        if capacity is not None and not (_is_number(capacity) and capacity >= 1):
+            console.print(f"[yellow]⚠ {name}: bucket_capacity must be >= 1, using default[/yellow]")
+            capacity = None
+        rate = site.get('bucket_rate')
+        if rate is not None and not (_is_number(rate) and rate > 0):
+            console.print(f"[yellow]⚠ {name}: bucket_rate must be > 0, using default[/yellow]")
+            rate = None
+        
+        self.sites.append(site)
+        self._names.append(name)
+        self._templates.append(template)
+        # Bind the specialized check once so the scan never re-dispatches on type
+        self._checks.append(getattr(self, check))
+        self._err_patterns.append(pattern)
+        self._err_lens.append(max_len)
+        # Validated bucket overrides (None = checker default)
+        self._bucket_caps.append(capacity)
+        self._bucket_rates.append(rate)
+        return len(self.sites) - 1
+
+    def _bucket_for(self, i: int, url: str) -> TokenBucket:
+        """Get (or create) the token bucket for a site's host
+
+        Buckets are shared per host, so the first site seen for a host sets its overrides.
+        Resolved once per formatted URL, not per request.
+        """
+        host = urlparse(url).netloc
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            capacity, rate = self._bucket_caps[i], self._bucket_rates[i]
+            bucket = self._buckets[host] = TokenBucket(
+                self.host_capacity if capacity is None else capacity,
+                self.host_rate if rate is None else rate
+            )
+        return bucket
+
+    @staticmethod
+    async def _body_contains(response: httpx.Response, pattern: re.Pattern,
+                             needle_len: int) -> Optional[bool]:
+        """Stream the body until pattern matches or the scan limit is hit
+
+        Returns True on a match, False if the whole body was read without one,
+        and None if the scan limit was reached first (the outcome is unknown).
+        """
+        tail = b''
+        seen = 0
+        async for chunk in response.aiter_bytes():
+            # Keep the end of the previous chunk so split matches aren't missed
+            window = tail + chunk
+            if pattern.search(window):
+                return True
+            seen += len(chunk)
+            if seen > BODY_SCAN_LIMIT:
+                return None
+            tail = window[-(needle_len - 1):] if needle_len > 1 else b''
+        return False
+
+    async def _send_status(self, url: str, client: httpx.AsyncClient, headers: Dict):
+        """Request a status_code site: only the status matters, so skip the body unless HEAD is refused"""
+        response = await client.head(url, headers=headers, timeout=self._timeout, follow_redirects=True)
+        if response.status_code == 405:
+            response = await client.get(url, headers=headers, timeout=self._timeout, follow_redirects=True)
+        return response, False
+
+    async def _send_body(self, url: str, client: httpx.AsyncClient, headers: Dict,
+                         pattern: Optional[re.Pattern], needle_len: int):
+        """Request a message_body site, streaming until the error message shows up"""
+        async with client.stream("GET", url, headers=headers, timeout=self._timeout,
+                                 follow_redirects=True) as response:
+            body_match = (response.status_code == 200 and pattern is not None
+                          and await self._body_contains(response, pattern, needle_len))
+        return response, body_match
+
+    async def _request(self, url: str, bucket: TokenBucket, client: httpx.AsyncClient, send, *args):
+        """Throttle and send a request, retrying 429s and timeouts with backoff"""
+        for attempt in range(MAX_ATTEMPTS):
+            last = attempt == MAX_ATTEMPTS - 1
+            
+            # Wait for this host's bucket before taking a global slot
+            while not bucket.consume(1):
+                await asyncio.sleep(1 / bucket.rate)
+            
+            try:
+                # Bounded by the pool, throttled by the shared limiter
+                async with self._sem, self.limiter:
+                    response, body_match = await send(url, client, next(_UA_CYCLE), *args)
+            except httpx.TimeoutException:
+                if last:
+                    raise
+                await asyncio.sleep(min(2 ** attempt, RETRY_MAX_DELAY))
+                continue
+            if response.status_code != 429 or last:
+                break
+            await asyncio.sleep(self._retry_delay(response, attempt))
+        
+        return response, body_match
+
+    @staticmethod
+    def _retry_delay(response: httpx.Response, attempt: int) -> float:
+        """Backoff before retrying a 429, honoring Retry-After when present"""
+        retry_after = response.headers.get('Retry-After')
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                # HTTP-date form
+                try:
+                    delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    delay = 2 ** attempt
+        else:
+            delay = 2 ** attempt
+        return max(0.0, min(delay, RETRY_MAX_DELAY))
+
+    def _new_result(self, i: int, url: str) -> Dict:
+        """Blank result for site i"""
+        return {
+            'site': self._names[i],
             'url': url,
             'status': 'unknown',
             'error': None
         }
-        
-        try:
-            # Random User-Agent rotation
-            headers = {'User-Agent': random.choice(USER_AGENTS)}
-            
-            # Make async request
-            response = await client.get(url, headers=headers, timeout=self.timeout, follow_redirects=True)
-            
-            # Detection logic
-            if detection_type == "status_code":
-                # Simple status code check (200 = exists, 404 = not found)
-                if response.status_code == 200:
-                    result['status'] = 'found'
-                elif response.status_code == 404:
-                    result['status'] = 'not_found'
-                else:
-                    result['status'] = 'unknown'
-                    result['error'] = f"Unexpected status: {response.status_code}"
-            
-            elif detection_type == "message_body":
-                # Advanced: Check for error message in body (handles "soft 404s")
-                error_message = site.get('error_message', '')
-                
-                if response.status_code == 200:
-                    # Check if error message is in the response body
-                    if error_message and error_message.lower() in response.text.lower():
-                        result['status'] = 'not_found'
-                    else:
-                        result['status'] = 'found'
-                elif response.status_code == 404:
-                    result['status'] = 'not_found'
-                else:
-                    result['status'] = 'unknown'
-                    result['error'] = f"Status: {response.status_code}"
-            
-            # Rate limiting
-            await asyncio.sleep(self.rate_limit)
-            
-        except httpx.TimeoutException:
-            result['status'] = 'error'
+
+    @staticmethod
+    def _set_error(result: Dict, e: Exception):
+        """Record a failed request on result"""
+        result['status'] = 'error'
+        if isinstance(e, httpx.TimeoutException):
             result['error'] = 'Timeout'
-        except httpx.ConnectError:
-            result['status'] = 'error'
+        elif isinstance(e, httpx.ConnectError):
             result['error'] = 'Connection failed'
-        except httpx.UnsupportedProtocol:
-            result['status'] = 'error'
+        elif isinstance(e, httpx.UnsupportedProtocol):
             result['error'] = 'SSL/TLS error'
-        except Exception as e:
-            result['status'] = 'error'
+        else:
             result['error'] = str(e)
+
+    async def _check_status(self, i: int, url: str, bucket: TokenBucket, client: httpx.AsyncClient) -> Dict:
+        """Simple status code check (200 = exists, 404 = not found)"""
+        result = self._new_result(i, url)
+        try:
+            response, _ = await self._request(url, bucket, client, self._send_status)
+        except Exception as e:
+            self._set_error(result, e)
+            return result
+        
+        if response.status_code == 200:
+            result['status'] = 'found'
+        elif response.status_code == 404:
+            result['status'] = 'not_found'
+        else:
+            result['error'] = f"Unexpected status: {response.status_code}"
+        return result
+
+    async def _check_body(self, i: int, url: str, bucket: TokenBucket, client: httpx.AsyncClient) -> Dict:
+        """Advanced: Check for error message in body (handles "soft 404s")"""
+        result = self._new_result(i, url)
+        try:
+            response, body_match = await self._request(
+                url, bucket, client, self._send_body, self._err_patterns[i], self._err_lens[i])
+        except Exception as e:
+            self._set_error(result, e)
+            return result
         
+        if response.status_code == 404:
+            result['status'] = 'not_found'
+        elif response.status_code == 200:
+            if body_match is None:
+                # Error message could sit past the part we read: don't guess
+                result['status'] = 'error'
+                result['error'] = f"Body exceeded scan limit ({BODY_SCAN_LIMIT // 1024} KB)"
+            else:
+                result['status'] = 'not_found' if body_match else 'found'
+        else:
+            result['error'] = f"Status: {response.status_code}"
+        return result
+
+    async def _check_unknown(self, i: int, url: str, bucket: TokenBucket, client: httpx.AsyncClient) -> Dict:
+        """Site with an unsupported detection_type: report it without a request"""
+        result = self._new_result(i, url)
+        result['status'] = 'error'
+        result['error'] = f"Unknown detection_type: {self.sites[i].get('detection_type')!r}"
         return result
 
+    async def check_username(self, i: int, username: str, client: httpx.AsyncClient) -> Dict:
+        """Check if username exists on the site at index i"""
+        url = self._templates[i].format(username=username)
+        return await self._checks[i](i, url, self._bucket_for(i, url), client)
+
+    def _make_client(self) -> httpx.AsyncClient:
+        """Create an async HTTP client with custom settings"""
+        return httpx.AsyncClient(
+            verify=_INSECURE_SSL_CTX if self.insecure else _SSL_CTX,
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections // 5,
+                keepalive_expiry=15.0
+            ),
+            timeout=self._timeout
+        )
+
+    async def aclose(self):
+        """Close the shared HTTP client, if any"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    async def _warm_dns(self):
+        """Resolve every distinct site host concurrently ahead of the scan"""
+        loop = asyncio.get_running_loop()
+        hosts = {urlparse(url).hostname for url in self._urls}
+        hosts.discard(None)
+        # Failures are left for the real request to report; a slow resolver
+        # only delays the scan by DNS_WARMUP_TIMEOUT. This only pays off where
+        # the OS caches lookups (nscd, systemd-resolved, macOS, Windows).
+        try:
+            await asyncio.wait_for(asyncio.gather(
+                *(loop.getaddrinfo(host, 443, proto=socket.IPPROTO_TCP) for host in hosts),
+                return_exceptions=True
+            ), timeout=DNS_WARMUP_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _check_and_record(self, i: int, client: httpx.AsyncClient, progress: Progress, task: TaskID):
+        """Check a single site and file the result into its category"""
+        result = await self._checks[i](i, self._urls[i], self._site_buckets[i], client)
+        
+        # Categorize results
+        if result['status'] == 'found':
+            self.results['found'].append(result)
+        elif result['status'] == 'not_found':
+            self.results['not_found'].append(result)
+        else:
+            self.results['errors'].append(result)
+        
+        # Batch bar updates to keep terminal redraws down
+        self._done += 1
+        if self._done % PROGRESS_BATCH == 0 or self._done == len(self.sites):
+            progress.update(task, completed=self._done)
+
+    async def _stream_scan(self, tg: asyncio.TaskGroup, username: str, client: httpx.AsyncClient,
+                           progress: Progress, task: TaskID):
+        """Parse the sites file incrementally, starting each check as its site is decoded"""
+        self._reset_sites()
+        tasks = []
+        try:
+            with open(self.sites_file, 'rb') as f:
+                for site in ijson.items(f, 'sites.item', use_float=True):
+                    # Format first: a bad template must fail before anything is appended
+                    url = site['url_template'].format(username=username)
+                    i = self._add_site(site)
+                    self._urls.append(url)
+                    self._site_buckets.append(self._bucket_for(i, url))
+                    tasks.append(tg.create_task(self._check_and_record(i, client, progress, task)))
+                    
+                    # Yield now and then so started requests get going
+                    if len(self.sites) % PROGRESS_BATCH == 0:
+                        progress.update(task, total=len(self.sites))
+                        await asyncio.sleep(0)
+        except Exception as e:
+            # Same outcome as a bad small file: stop the scan, results are incomplete
+            console.print(f"[red]Error loading sites: {e}[/red]")
+            self.scan_complete = False
+            for t in tasks:
+                t.cancel()
+            return
+        
+        progress.update(task, total=len(self.sites))
+
     async def scan_username(self, username: str) -> Dict[str, List[Dict]]:
         """Scan username across all loaded sites"""
         console.print(Panel.fit(
@@ -127,12 +529,23 @@ class UsernameChecker:
             border_style="cyan"
         ))
         
-        # Create async HTTP client with custom settings
-        async with httpx.AsyncClient(
-            verify=True,
-            http2=True,
-            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
-        ) as client:
+        if not self._stream_sites:
+            # Format every site URL once up front
+            self._urls = [template.format(username=username) for template in self._templates]
+            # Hosts can depend on the username ({username}.example.com)
+            self._site_buckets = [self._bucket_for(i, url) for i, url in enumerate(self._urls)]
+            
+            # Warm the resolver cache so connections don't queue on DNS
+            await self._warm_dns()
+        
+        # Start each scan with empty results
+        self.results = {"found": [], "not_found": [], "errors": []}
+        self._done = 0
+        self.scan_complete = True
+        
+        # Reuse the injected client, or open one for this scan only
+        async with contextlib.AsyncExitStack() as stack:
+            client = self.client or await stack.enter_async_context(self._make_client())
             
             # Create progress bar
             with Progress(
@@ -140,27 +553,22 @@ class UsernameChecker:
                 TextColumn("[progress.description]{task.description}"),
                 BarColumn(),
                 TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                console=console
+                console=console,
+                refresh_per_second=8
             ) as progress:
                 
-                task = progress.add_task("[cyan]Checking sites...", total=len(self.sites))
-                
-                # Create tasks for all sites
-                tasks = [self.check_username(site, username, client) for site in self.sites]
+                task = progress.add_task("[cyan]Checking sites...",
+                                         total=None if self._stream_sites else len(self.sites))
                 
-                # Execute concurrently with progress updates
-                for coro in asyncio.as_completed(tasks):
-                    result = await coro
-                    
-                    # Categorize results
-                    if result['status'] == 'found':
-                        self.results['found'].append(result)
-                    elif result['status'] == 'not_found':
-                        self.results['not_found'].append(result)
+                # Execute concurrently; each task records its own result
+                async with asyncio.TaskGroup() as tg:
+                    if self._stream_sites:
+                        await self._stream_scan(tg, username, client, progress, task)
                     else:
-                        self.results['errors'].append(result)
-                    
-                    progress.update(task, advance=1)
+                        for i in range(len(self.sites)):
+                            tg.create_task(self._check_and_record(i, client, progress, task))
+                
+                progress.update(task, completed=self._done)
         
         return self.results
 
@@ -186,26 +594,27 @@ class UsernameChecker:
         if self.results['errors']:
             console.print(f"\n[dim]⚠ {len(self.results['errors'])} errors/timeouts occurred[/dim]")
 
-    def export_results(self, username: str, format: str = "txt"):
+    async def export_results(self, username: str, format: str = "txt"):
         """Export found results to file"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         if format == "txt":
             filename = f"{username}_{timestamp}.txt"
-            with open(filename, 'w') as f:
-                f.write(f"Username Check Results: {username}\n")
-                f.write(f"Scan Date: {datetime.now()}\n")
-                f.write(f"{'='*60}\n\n")
-                
-                if self.results['found']:
-                    f.write(f"FOUND ON {len(self.results['found'])} PLATFORMS:\n\n")
-                    for result in self.results['found']:
-                        f.write(f"  • {result['site']}\n")
-                        f.write(f"    {result['url']}\n\n")
-                else:
-                    f.write("No accounts found.\n")
+            lines = [
+                f"Username Check Results: {username}\n",
+                f"Scan Date: {datetime.now()}\n",
+                f"{'='*60}\n\n",
+            ]
             
-            console.print(f"[green]✓[/green] Results exported to [cyan]{filename}[/cyan]")
+            if self.results['found']:
+                lines.append(f"FOUND ON {len(self.results['found'])} PLATFORMS:\n\n")
+                for result in self.results['found']:
+                    lines.append(f"  • {result['site']}\n")
+                    lines.append(f"    {result['url']}\n\n")
+            else:
+                lines.append("No accounts found.\n")
+            
+            payload = "".join(lines).encode()
         
         elif format == "json":
             filename = f"{username}_{timestamp}.json"
@@ -220,10 +629,32 @@ class UsernameChecker:
                 "results": self.results['found']
             }
             
-            with open(filename, 'w') as f:
-                json.dump(export_data, f, indent=2)
-            
-            console.print(f"[green]✓[/green] Results exported to [cyan]{filename}[/cyan]")
+            if orjson:
+                payload = orjson.dumps(export_data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(export_data, indent=2).encode()
+        
+        else:
+            return
+        
+        # Write off the event loop so the export never blocks it
+        await asyncio.to_thread(Path(filename).write_bytes, payload)
+        
+        console.print(f"[green]✓[/green] Results exported to [cyan]{filename}[/cyan]")
+
+def _positive_float(value: str) -> float:
+    """argparse type for options that must be > 0"""
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be > 0, got {value}")
+    return number
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be >= 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {value}")
+    return number
 
 async def main():
     parser = argparse.ArgumentParser(
@@ -233,14 +664,19 @@ async def main():
 Examples:
   python username_checker.py johndoe
   python username_checker.py johndoe --export json
-  python username_checker.py johndoe --timeout 15 --rate-limit 1.0
+  python username_checker.py johndoe --timeout 15 --max-rate 10
+  python username_checker.py johndoe --rate-limit 1.0
         """
     )
     
     parser.add_argument('username', help='Username to search for')
     parser.add_argument('--sites', default='sites.json', help='Path to sites JSON file (default: sites.json)')
     parser.add_argument('--timeout', type=int, default=10, help='Request timeout in seconds (default: 10)')
-    parser.add_argument('--rate-limit', type=float, default=0.5, help='Delay between requests in seconds (default: 0.5)')
+    parser.add_argument('--max-rate', type=_positive_float, default=50.0, help='Maximum requests per second across all sites (default: 50)')
+    parser.add_argument('--rate-limit', type=_positive_float, default=None, help='Legacy mode: one request every N seconds (overrides --max-rate)')
+    parser.add_argument('--max-connections', type=_positive_int, default=256, help='Maximum concurrent connections (default: 256)')
+    parser.add_argument('--http2', action='store_true', help='Negotiate HTTP/2 where supported (default: HTTP/1.1)')
+    parser.add_argument('--insecure', action='store_true', help='Do not verify TLS certificates')
     parser.add_argument('--export', choices=['txt', 'json'], help='Export results to file')
     parser.add_argument('--no-color', action='store_true', help='Disable colored output')
     
@@ -258,7 +694,11 @@ Examples:
     checker = UsernameChecker(
         sites_file=args.sites,
         timeout=args.timeout,
-        rate_limit=args.rate_limit
+        max_rate=args.max_rate,
+        rate_limit=args.rate_limit,
+        max_connections=args.max_connections,
+        http2=args.http2,
+        insecure=args.insecure
     )
     
     # Load sites
@@ -267,13 +707,16 @@ Examples:
     
     # Scan username
     await checker.scan_username(args.username)
+    if not checker.scan_complete:
+        console.print("[red]Scan aborted: results are incomplete.[/red]")
+        return
     
     # Display results
     checker.display_results(args.username)
     
     # Export if requested
     if args.export:
-        checker.export_results(args.username, args.export)
+        await checker.export_results(args.username, args.export)
     
     # Summary
     console.print(f"\n[bold]Scan Complete![/bold]")
@@ -282,4 +725,6 @@ Examples:
     console.print(f"  Errors: [yellow]{len(checker.results['errors'])}[/yellow]\n")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Prefer uvloop's C event loop when installed
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+        runner.run(main())